@@ -1,32 +1,39 @@
 import os
 import shutil
+import stat
 from src.ui import ConsoleUI
 from .futils import FileSelector, FileExplorer, FileSystem, FileManager
 
 
 class StdFileSystem(FileSystem):
-    def copy(src: str, dest: str) -> None:
+    def copy(self, src: str, dest: str) -> None:
         """Copy a file from src to dest"""
         if os.path.exists(src):
             shutil.copy2(src, dest)
 
-    def move(src: str, dest: str) -> None:
+    def move(self, src: str, dest: str) -> None:
         """Move a file from src to dest"""
         if os.path.exists(src):
             shutil.move(src, dest)
 
-    def delete(path: str) -> None:
+    def delete(self, path: str) -> None:
         """Delete a file"""
-        if os.path.isfile(path):
+        # Un seul stat pour distinguer fichier et dossier
+        try:
+            mode = os.stat(path).st_mode
+        except (OSError, ValueError):
+            return
+        if stat.S_ISREG(mode):
             os.remove(path)
-        elif os.path.isdir(path):
+        elif stat.S_ISDIR(mode):
             shutil.rmtree(path)
 
 
 def main_menu():
     file_selector = FileSelector()
-    file_manager = FileManager(file_selector, StdFileSystem(), ConsoleUI())
     file_explorer = FileExplorer()
+    file_manager = FileManager(file_selector, StdFileSystem(), ConsoleUI(),
+                               on_change=file_explorer.invalidate)
     
     while True:
         print("\n--- File Explorer ---")
@@ -1,8 +1,68 @@
+import io
 import os
-from typing import Callable
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator
 from src.ui import UserInterface, ErrorChoice
 from pathlib import Path
 
+class _Choice:
+    """Plain int values of ErrorChoice, usable as match value patterns"""
+    STOP = int(ErrorChoice.STOP)
+    IGNORE_ALL = int(ErrorChoice.IGNORE_ALL)
+
+
+# Directory listing cache defaults for FileExplorer
+LISTING_CACHE_MAXLEN = 128
+LISTING_CACHE_TTL = 5.0
+
+# Directory listings are written to stdout in chunks of this many characters
+DISPLAY_BUFFER_SIZE = 64 * 1024
+
+
+def _path_str_error(path: str) -> str:
+    """Return why a path fails the string-level checks, or "" if it passes"""
+    path = os.path.normpath(os.fspath(path))
+    # Vérifie la longueur du chemin
+    if len(path) > 255:  # ou utilisez os.pathconf('/', 'PC_PATH_MAX') sur Unix
+        return "Path too long"
+    if "\0" in path:
+        return "embedded null byte"
+    return ""
+
+
+def _check_path(path: str) -> None:
+    """Raise ValueError if a path fails the string-level checks"""
+    err_msg = _path_str_error(path)
+    if err_msg:
+        raise ValueError(f"Invalid path: {err_msg}")
+
+
+def _validate_path_resolved(path: str) -> tuple[bool, str]:
+    """Validate a path, resolving it against the file system.
+    
+    Returns:
+        tuple[bool, str]: (True, "") if the path is valid, (False, reason) otherwise
+    """
+    path = os.fspath(path)
+    err_msg = _path_str_error(path)
+    if err_msg:
+        return False, err_msg
+    
+    # Un chemin ASCII sans octet nul est toujours accepté
+    if path.isascii():
+        return True, ""
+    
+    try:
+        # Vérifie si le chemin contient des caractères valides
+        Path(path).resolve()
+        return True, ""
+    except (OSError, ValueError) as e:
+        return False, str(e)
+
+
 class FileListProvider:
     def subset(indices: list[int]) -> list[str]:
         pass
@@ -12,6 +72,9 @@ class FileSelection:
     def get_and_reset() -> list[str]:
         pass
 
+    def peek_count() -> int:
+        pass
+
 
 class FileSystem:
     def copy(src: str, dest: str) -> None:
@@ -33,9 +96,8 @@ class FileSelector(FileSelection):
         try:
             self.selected_files = file_explorer.subset(indices)
             
-            print("Selected files:")
-            for file in self.selected_files:
-                print(f" - {os.path.basename(file)}")
+            names = [os.path.basename(file) for file in self.selected_files]
+            print("\n - ".join(["Selected files:", *names]))
             
             return self.selected_files
         except Exception as e:
@@ -44,72 +106,199 @@ class FileSelector(FileSelection):
  
     def get_and_reset(self) -> list[str]:
         """Return the list of currently selected files"""
-        res = self.selected_files.copy()
-        self.selected_files.clear()
+        res, self.selected_files = self.selected_files, []
         return res
 
+    def peek_count(self) -> int:
+        """Return the number of currently selected files without resetting the selection"""
+        return len(self.selected_files)
+
 
 class FileExplorer(FileListProvider):
-    def __init__(self):
+    def __init__(self, cache_size: int = LISTING_CACHE_MAXLEN, cache_ttl: float = LISTING_CACHE_TTL):
+        # Listings of recently visited directories: interned absolute path -> (timestamp, entries)
+        self._listings = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._pending = None
+        self._stale = False
         self._set_current_path(os.path.expanduser('~'))
 
+    def _cached_listing(self, key: str) -> list[os.DirEntry] | None:
+        """Return the cached entries of a directory, or None if missing or expired"""
+        cached = self._listings.get(key)
+        if cached is None or time.monotonic() - cached[0] >= self._cache_ttl:
+            return None
+        self._listings.move_to_end(key)
+        return cached[1]
+
+    def _store_listing(self, key: str, entries: list[os.DirEntry]) -> None:
+        """Cache the complete entries of a directory"""
+        self._listings[key] = (time.monotonic(), entries)
+        self._listings.move_to_end(key)
+        while len(self._listings) > self._cache_size:
+            self._listings.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached listings of a path and of its parent directory"""
+        key = os.path.abspath(path)
+        parent = os.path.dirname(key)
+        self._listings.pop(key, None)
+        self._listings.pop(parent, None)
+        if self.current_path in (key, parent):
+            # Relisté au prochain affichage ou déplacement
+            self._stale = True
+
+    def _refresh(self) -> None:
+        """Re-list the current directory if it was invalidated"""
+        if self._stale:
+            self._set_nearest_existing_path(self.current_path)
+
+    def _set_nearest_existing_path(self, path: str) -> None:
+        """Set the current path, falling back to the nearest existing ancestor
+        when the directory no longer exists"""
+        while True:
+            try:
+                self._set_current_path(path)
+                return
+            except FileNotFoundError:
+                parent = os.path.dirname(path)
+                if parent == path:
+                    raise
+                path = parent
+
     def _set_current_path(self, path: str) -> None:
-        """Set current path and update the contents of the current directory"""
-        self.current_path = path
-        self.current_directory_contents = os.listdir(self.current_path)
+        """Set current path and start listing the contents of the current directory"""
+        # Chemin absolu interné, partagé avec les clés du cache
+        self.current_path = sys.intern(os.path.abspath(path))
+        if self._pending is not None:
+            self._pending.close()
+            self._pending = None
+        
+        cached = self._cached_listing(self.current_path)
+        if cached is not None:
+            self._seen = cached
+        else:
+            self._seen = []
+            self._pending = os.scandir(self.current_path)
+        self._stale = False
+
+    def _iter_entries(self) -> Iterator[os.DirEntry]:
+        """Yield the entries of the current directory, reading the listing lazily"""
+        self._refresh()
+        index = 0
+        while True:
+            if index < len(self._seen):
+                yield self._seen[index]
+                index += 1
+            elif self._pending is None:
+                return
+            else:
+                entry = next(self._pending, None)
+                if entry is None:
+                    self._pending.close()
+                    self._pending = None
+                    self._store_listing(self.current_path, self._seen)
+                else:
+                    self._seen.append(entry)
+
+    def _read_until(self, index: int) -> None:
+        """Read the listing until the entry at index is available or the directory is exhausted"""
+        for position, _ in enumerate(self._iter_entries()):
+            if position >= index:
+                break
+
+    def _entry(self, index: int) -> os.DirEntry:
+        """Return the entry at index, reading the listing only as far as needed"""
+        if index < 0:
+            return self.current_directory_contents[index]
+        self._read_until(index)
+        return self._seen[index]
+
+    @property
+    def current_directory_contents(self) -> list[os.DirEntry]:
+        """All entries of the current directory"""
+        for _ in self._iter_entries():
+            pass
+        return self._seen
 
     def display_directory_contents(self) -> None:
         """Display contents of the current directory"""
+        buf = io.StringIO()
         try:
-            print(f"\nCurrent Directory: {self.current_path}")
-            print("-" * 50)
-            for index, element in enumerate(self.current_directory_contents):
-                full_path = os.path.join(self.current_path, element)
-                element_type = "📁 Folder" if os.path.isdir(full_path) else "📄 File"
-                print(f"{index}. {element_type}: {element}")
+            self._refresh()
+            buf.write(f"\nCurrent Directory: {self.current_path}\n")
+            buf.write("-" * 50 + "\n")
+            for index, entry in enumerate(self._iter_entries()):
+                element_type = "📁 Folder" if entry.is_dir() else "📄 File"
+                buf.write(f"{index}. {element_type}: {entry.name}\n")
+                if buf.tell() >= DISPLAY_BUFFER_SIZE:
+                    sys.stdout.write(buf.getvalue())
+                    buf = io.StringIO()
         except PermissionError:
-            print("Access denied to this directory.")
+            buf.write("Access denied to this directory.\n")
         except Exception as e:
-            print(f"Error: {e}")
+            buf.write(f"Error: {e}\n")
+        sys.stdout.write(buf.getvalue())
 
     def navigate(self, index: int) -> None:
         """Navigate to a subdirectory"""
         try:
-            selected_element = self.current_directory_contents[index]
-            full_path = os.path.join(self.current_path, selected_element)
+            selected_entry = self._entry(index)
             
-            if os.path.isdir(full_path):
-                self._set_current_path(full_path)
+            if selected_entry.is_dir():
+                self._set_current_path(selected_entry.path)
                 self.display_directory_contents()
             else:
-                print(f"Cannot open file {selected_element}")
+                print(f"Cannot open file {selected_entry.name}")
         except Exception as e:
             print(f"Navigation error: {e}")
 
     def go_to_parent_directory(self) -> None:
         """Move to the parent directory"""
-        self._set_current_path(os.path.dirname(self.current_path))
+        self._set_nearest_existing_path(os.path.dirname(self.current_path))
         self.display_directory_contents()
 
     def subset(self, indices: list[int]) -> list[str]:
         """Return a subset of the current directory contents"""
-        selected_files = []
-        for index in indices:
-            if 0 <= index < len(self.current_directory_contents):
-                full_path = os.path.join(self.current_path, self.current_directory_contents[index])
-                selected_files.append(full_path)
-        return selected_files
+        self._read_until(max(indices, default=0))
+        contents = self._seen
+        n = len(contents)
+        return [contents[index].path for index in indices if 0 <= index < n]
 
 
 class FileManager:
-    def __init__(self, file_selection: FileSelection, file_system: FileSystem, user_interface: UserInterface):
+    def __init__(self, file_selection: FileSelection, file_system: FileSystem, user_interface: UserInterface,
+                 parallel: bool = False, on_change: Callable[[str], None] | None = None):
         self.sel = file_selection
         self.fs = file_system
         self.ui = user_interface
         self.ignore_all_errors = False
+        self.parallel = parallel
+        self.on_change = on_change
+        self._pending_errors = []
 
-    def _validate_path(self, path: str) -> bool:
-        """Validate if a path is acceptable.
+    def _notify_change(self, path: str) -> None:
+        """Tell the on_change callback, if any, that a path was modified"""
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(path)
+        except Exception as e:
+            self._report_error(f"Change notification: {str(e)}")
+
+    def _report_error(self, msg: str) -> None:
+        """Queue an error message until the current operation finishes"""
+        self._pending_errors.append(msg)
+
+    def _flush_errors(self) -> None:
+        """Send all queued error messages to the user interface at once"""
+        if self._pending_errors:
+            msgs, self._pending_errors = self._pending_errors, []
+            self.ui.errors_batch(msgs)
+
+    def _validate_path_resolve(self, path: str) -> bool:
+        """Validate a path, resolving it against the file system.
         
         Args:
             path: The path to validate
@@ -117,18 +306,10 @@ class FileManager:
         Returns:
             bool: True if path is valid, False otherwise
         """
-        try:
-            # Vérifie la longueur du chemin
-            if len(str(Path(path))) > 255:  # ou utilisez os.pathconf('/', 'PC_PATH_MAX') sur Unix
-                raise OSError("Path too long")
-                
-            # Vérifie si le chemin contient des caractères valides
-            Path(path).resolve()
-            
-            return True
-        except (OSError, ValueError) as e:
-            self.ui.error(f"Invalid path: {str(e)}")
-            return False
+        ok, err_msg = _validate_path_resolved(path)
+        if not ok:
+            self._report_error(f"Invalid path: {err_msg}")
+        return ok
 
     def _handle_operation_error(self, operation: str, error: Exception) -> ErrorChoice:
         """Handle file operation errors.
@@ -141,44 +322,147 @@ class FileManager:
             ErrorChoice: User's decision on how to handle the error
         """
         error_msg = f"{operation}: {str(error)}"
-        self.ui.error(error_msg)
+        self._report_error(error_msg)
         
         if not self.ignore_all_errors:
             return self.ui.error_choice(error_msg)
         return ErrorChoice.IGNORE_ALL
 
-    def copy_files(self, destination: str) -> int:
-        """Copy selected files to destination.
+    def _apply_choice(self, choice: ErrorChoice) -> bool:
+        """Apply the user's decision after an error.
         
         Args:
-            destination: Destination path for the files
+            choice: The choice returned by _handle_operation_error
             
         Returns:
-            int: Number of successfully copied files
+            bool: True if the operation must stop, False otherwise
         """
-        if not self._validate_path(destination):
-            return 0
+        match choice:
+            case _Choice.STOP:
+                return True
+            case _Choice.IGNORE_ALL:
+                self.ignore_all_errors = True
+        return False
+
+    def _run(self, operation: str, action: Callable[..., None], files: list[str],
+             destination: str | None = None) -> int:
+        """Run a file operation on several files, in parallel if enabled.
+        
+        Args:
+            operation: The operation being performed ('Copy', 'Move', 'Delete')
+            action: Callable performing the operation on a single file
+            files: Files to process
+            destination: Destination passed to action after each file, if any
             
-        success_count = 0
-        files = self.sel.get_and_reset()
+        Returns:
+            int: Number of successfully processed files
+        """
+        if self.parallel:
+            return self._run_parallel(operation, action, files, destination)
+        return self._run_sequential(operation, action, files, destination)
+
+    def _run_sequential(self, operation: str, action: Callable[..., None], files: list[str],
+                        destination: str | None = None) -> int:
+        """Run a file operation on several files, one after the other.
         
+        Args:
+            operation: The operation being performed ('Copy', 'Move', 'Delete')
+            action: Callable performing the operation on a single file
+            files: Files to process
+            destination: Destination passed to action after each file, if any
+            
+        Returns:
+            int: Number of successfully processed files
+        """
+        # Attributs liés en variables locales pour la boucle
+        check, handle, apply_choice = _check_path, self._handle_operation_error, self._apply_choice
+        success_count = 0
         for file in files:
-            if not self._validate_path(file):
-                continue
-                
             try:
-                self.fs.copy(file, destination)
+                check(file)
+                # Appel direct : action(file, *args) coûte plus cher que ce test
+                if destination is None:
+                    action(file)
+                else:
+                    action(file, destination)
                 success_count += 1
             except Exception as e:
-                choice = self._handle_operation_error("Copy", e)
+                choice = handle(operation, e)
                 
-                if choice == ErrorChoice.STOP:
+                if apply_choice(choice):
                     break
-                elif choice == ErrorChoice.IGNORE_ALL:
-                    self.ignore_all_errors = True
-                    
         return success_count
 
+    def _run_parallel(self, operation: str, action: Callable[..., None], files: list[str],
+                      destination: str | None = None) -> int:
+        """Run a file operation on several files concurrently.
+        
+        Errors are handled on the calling thread as futures complete, so the
+        UI prompts never interleave.
+        
+        Args:
+            operation: The operation being performed ('Copy', 'Move', 'Delete')
+            action: Callable performing the operation on a single file
+            files: Files to process
+            destination: Destination passed to action after each file, if any
+            
+        Returns:
+            int: Number of successfully processed files
+        """
+        if not files:
+            return 0
+        
+        def run(file: str) -> None:
+            _check_path(file)
+            if destination is None:
+                action(file)
+            else:
+                action(file, destination)
+        
+        futures = []
+        executor = ThreadPoolExecutor(max_workers=min(32, len(files)))
+        try:
+            for file in files:
+                futures.append(executor.submit(run, file))
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    continue
+                    
+                choice = self._handle_operation_error(operation, error)
+                
+                if self._apply_choice(choice):
+                    break
+        finally:
+            # Annule le travail en attente si la boucle s'arrête avant la fin (STOP ou exception)
+            executor.shutdown(cancel_futures=True)
+        
+        return sum(1 for future in futures
+                   if not future.cancelled() and future.exception() is None)
+
+    def copy_files(self, destination: str) -> int:
+        """Copy selected files to destination.
+        
+        Args:
+            destination: Destination path for the files
+            
+        Returns:
+            int: Number of successfully copied files
+        """
+        if self.sel.peek_count() == 0:
+            return 0
+        
+        if not self._validate_path_resolve(destination):
+            self._flush_errors()
+            return 0
+            
+        files = self.sel.get_and_reset()
+        try:
+            return self._run("Copy", self.fs.copy, files, destination)
+        finally:
+            self._notify_change(destination)
+            self._flush_errors()
+
     def move_files(self, destination: str) -> int:
         """Move selected files to destination.
         
@@ -188,28 +472,21 @@ class FileManager:
         Returns:
             int: Number of successfully moved files
         """
-        if not self._validate_path(destination):
+        if self.sel.peek_count() == 0:
+            return 0
+        
+        if not self._validate_path_resolve(destination):
+            self._flush_errors()
             return 0
             
-        success_count = 0
         files = self.sel.get_and_reset()
-        
-        for file in files:
-            if not self._validate_path(file):
-                continue
-                
-            try:
-                self.fs.move(file, destination)
-                success_count += 1
-            except Exception as e:
-                choice = self._handle_operation_error("Move", e)
-                
-                if choice == ErrorChoice.STOP:
-                    break
-                elif choice == ErrorChoice.IGNORE_ALL:
-                    self.ignore_all_errors = True
-                    
-        return success_count
+        try:
+            return self._run("Move", self.fs.move, files, destination)
+        finally:
+            self._notify_change(destination)
+            for file in files:
+                self._notify_change(file)
+            self._flush_errors()
 
     def delete_files(self) -> int:
         """Delete selected files.
@@ -217,22 +494,13 @@ class FileManager:
         Returns:
             int: Number of successfully deleted files
         """
-        success_count = 0
-        files = self.sel.get_and_reset()
+        if self.sel.peek_count() == 0:
+            return 0
         
-        for file in files:
-            if not self._validate_path(file):
-                continue
-                
-            try:
-                self.fs.delete(file)
-                success_count += 1
-            except Exception as e:
-                choice = self._handle_operation_error("Delete", e)
-                
-                if choice == ErrorChoice.STOP:
-                    break
-                elif choice == ErrorChoice.IGNORE_ALL:
-                    self.ignore_all_errors = True
-                    
-        return success_count
+        files = self.sel.get_and_reset()
+        try:
+            return self._run("Delete", self.fs.delete, files)
+        finally:
+            for file in files:
+                self._notify_change(file)
+            self._flush_errors()
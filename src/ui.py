@@ -1,3 +1,4 @@
+import sys
 from enum import IntEnum
 
 class ErrorChoice(IntEnum):
@@ -9,12 +10,19 @@ class UserInterface:
     def error(self, msg: str) -> None:
         pass
     
+    def errors_batch(self, msgs: list[str]) -> None:
+        for msg in msgs:
+            self.error(msg)
+    
     def error_choice(self, msg: str) -> ErrorChoice:
         pass
 
 class ConsoleUI(UserInterface):
     def error(self, msg: str) -> None:
         print(msg)
+    
+    def errors_batch(self, msgs: list[str]) -> None:
+        sys.stdout.write("\n".join(msgs) + "\n")
         
     def error_choice(self, msg: str) -> ErrorChoice:
         print(f"Error: {msg}")
@@ -0,0 +1,286 @@
+import io
+import os
+import sys
+import pytest
+from src import futils
+from src.fmgr import StdFileSystem
+from src.futils import FileExplorer, FileManager, FileSelector
+from src.ui import UserInterface
+
+class CountingStdout(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+class ScandirSpy:
+    """Record the directories listed through os.scandir and the entries read from them"""
+    def __init__(self):
+        self.paths = []
+        self.entries_read = 0
+        self._scandir = os.scandir
+
+    def scandir(self, path):
+        self.paths.append(str(path))
+        return CountingIterator(self, self._scandir(path))
+
+class CountingIterator:
+    def __init__(self, spy: ScandirSpy, it):
+        self.spy = spy
+        self.it = it
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        entry = next(self.it)
+        self.spy.entries_read += 1
+        return entry
+
+    def close(self) -> None:
+        self.it.close()
+
+class TestFileExplorer:
+    @pytest.fixture
+    def home(self, tmp_path, monkeypatch):
+        """Set up a home directory with five files and two subdirectories.
+
+        Returns:
+            Path: The temporary home directory.
+        """
+        for i in range(5):
+            (tmp_path / f"file{i}.txt").write_text("x")
+        (tmp_path / "sub1").mkdir()
+        (tmp_path / "sub2").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        return tmp_path
+
+    @pytest.fixture
+    def scans(self, monkeypatch):
+        """Count the os.scandir calls made by FileExplorer.
+
+        Returns:
+            ScandirSpy: The spy recording listed directories and entries read.
+        """
+        spy = ScandirSpy()
+        monkeypatch.setattr(futils.os, "scandir", spy.scandir)
+        return spy
+
+    def names(self, explorer: FileExplorer) -> list[str]:
+        return [entry.name for entry in explorer.current_directory_contents]
+
+    def test_entries_read_lazily(self, home, scans):
+        """Test that subset only reads the listing as far as needed.
+
+        Given:
+            - A directory with seven entries
+        When:
+            - subset() is called with small indices
+        Then:
+            - Only the entries up to the highest index should be read
+            - The selected paths should match the full listing
+        """
+        explorer = FileExplorer()
+
+        first = explorer.subset([1])
+        assert scans.entries_read == 2
+
+        selected = explorer.subset([3, 0, 3])
+        assert scans.entries_read == 4
+
+        contents = explorer.current_directory_contents
+        assert scans.entries_read == 7
+        assert len(contents) == 7
+        assert first == [contents[1].path]
+        assert selected == [contents[3].path, contents[0].path, contents[3].path]
+        assert scans.paths == [str(home)]
+
+    def test_subset_ignores_out_of_range_indices(self, home):
+        explorer = FileExplorer()
+
+        selected = explorer.subset([-1, 2, 99])
+
+        assert selected == [explorer.current_directory_contents[2].path]
+
+    def test_navigate_negative_index(self, tmp_path, monkeypatch):
+        (tmp_path / "only").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        explorer = FileExplorer()
+
+        explorer.navigate(-1)
+
+        assert explorer.current_path == str(tmp_path / "only")
+
+    def test_listing_cached_until_ttl_expires(self, home, scans, monkeypatch):
+        """Test that a revisited directory is served from the cache until it expires.
+
+        Given:
+            - A fully listed home directory
+            - A file created afterwards
+        When:
+            - The user goes into a subdirectory and back, before and after the TTL
+        Then:
+            - The cached listing should be reused while fresh
+            - The directory should be rescanned once the TTL has passed
+        """
+        now = [1000.0]
+        monkeypatch.setattr(futils.time, "monotonic", lambda: now[0])
+        explorer = FileExplorer(cache_ttl=5.0)
+        sub1 = self.names(explorer).index("sub1")
+        (home / "new.txt").write_text("x")
+
+        explorer.navigate(sub1)
+        explorer.go_to_parent_directory()
+        assert scans.paths.count(str(home)) == 1
+        assert "new.txt" not in self.names(explorer)
+
+        now[0] += 5.0
+        explorer.navigate(sub1)
+        explorer.go_to_parent_directory()
+        assert scans.paths.count(str(home)) == 2
+        assert "new.txt" in self.names(explorer)
+
+    def test_lru_evicts_least_recently_used_listing(self, home, scans):
+        """Test that the listing cache keeps only the most recently used directories.
+
+        Given:
+            - A cache holding two listings
+        When:
+            - The user visits home, sub1, home, sub2, home, then sub1 again
+        Then:
+            - home should stay cached, being used between every visit
+            - sub1 should have been evicted by sub2 and listed again
+        """
+        explorer = FileExplorer(cache_size=2)
+        names = self.names(explorer)
+
+        for name in ("sub1", "sub2", "sub1"):
+            explorer.navigate(names.index(name))
+            explorer.go_to_parent_directory()
+
+        assert scans.paths.count(str(home)) == 1
+        assert scans.paths.count(str(home / "sub1")) == 2
+        assert scans.paths.count(str(home / "sub2")) == 1
+
+    def test_invalidate_parent_listing(self, home, scans):
+        explorer = FileExplorer()
+        explorer.navigate(self.names(explorer).index("sub1"))
+        scans.paths.clear()
+
+        explorer.invalidate(str(home / "file0.txt"))
+        explorer.display_directory_contents()
+        explorer.go_to_parent_directory()
+
+        assert scans.paths == [str(home)]
+
+    def test_invalidate_current_directory_relists_lazily(self, home, scans):
+        """Test that invalidating the current directory defers the rescan.
+
+        Given:
+            - A fully listed current directory
+            - A file created afterwards
+        When:
+            - invalidate() is called with the new file
+        Then:
+            - The directory should not be listed again right away
+            - The new file should appear on the next access
+        """
+        explorer = FileExplorer()
+        self.names(explorer)
+        (home / "new.txt").write_text("x")
+
+        explorer.invalidate(str(home / "new.txt"))
+        assert scans.paths == [str(home)]
+
+        assert "new.txt" in self.names(explorer)
+        assert scans.paths == [str(home), str(home)]
+
+    def test_deleting_current_directory_falls_back_to_parent(self, home, capsys):
+        """Test deleting the directory the explorer is currently in.
+
+        Given:
+            - sub1 selected, then opened in the explorer
+        When:
+            - delete_files() is called
+        Then:
+            - Should return 1 without raising
+            - The next display should show the parent directory
+        """
+        explorer = FileExplorer()
+        selector = FileSelector()
+        manager = FileManager(selector, StdFileSystem(), UserInterface(),
+                              on_change=explorer.invalidate)
+        index = self.names(explorer).index("sub1")
+        selector.select_files_by_indices([index], explorer)
+        explorer.navigate(index)
+
+        assert manager.delete_files() == 1
+
+        capsys.readouterr()
+        explorer.display_directory_contents()
+
+        assert f"Current Directory: {home}\n" in capsys.readouterr().out
+        assert "sub1" not in self.names(explorer)
+
+    def test_go_to_parent_after_current_directory_deleted(self, home, capsys):
+        """Test going up from a directory that was deleted.
+
+        Given:
+            - The explorer inside sub1/inner
+            - inner deleted through FileManager
+        When:
+            - go_to_parent_directory() is called
+        Then:
+            - The explorer should land in sub1, not one level higher
+        """
+        inner = home / "sub1" / "inner"
+        inner.mkdir()
+        explorer = FileExplorer()
+        selector = FileSelector()
+        manager = FileManager(selector, StdFileSystem(), UserInterface(),
+                              on_change=explorer.invalidate)
+        explorer.navigate(self.names(explorer).index("sub1"))
+        selector.select_files_by_indices([0], explorer)
+        explorer.navigate(0)
+        manager.delete_files()
+
+        explorer.go_to_parent_directory()
+
+        assert f"Current Directory: {home / 'sub1'}\n" in capsys.readouterr().out
+        assert self.names(explorer) == []
+
+    def test_go_to_parent_does_not_relist_invalidated_directory(self, home, scans):
+        explorer = FileExplorer()
+        explorer.navigate(self.names(explorer).index("sub1"))
+        explorer.invalidate(str(home / "sub1" / "new.txt"))
+        scans.paths.clear()
+
+        explorer.go_to_parent_directory()
+
+        # home is still cached and sub1 must not be listed again before leaving it
+        assert scans.paths == []
+
+    def test_display_writes_once(self, home, monkeypatch):
+        stdout = CountingStdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        explorer = FileExplorer()
+
+        explorer.display_directory_contents()
+
+        assert stdout.writes == 1
+        assert stdout.getvalue().count("\n") == 10
+
+    def test_display_flushes_full_buffer(self, home, monkeypatch):
+        stdout = CountingStdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        monkeypatch.setattr(futils, "DISPLAY_BUFFER_SIZE", 1)
+        explorer = FileExplorer()
+
+        explorer.display_directory_contents()
+
+        # One write per entry, plus the final (empty) flush
+        assert stdout.writes == 8
+        assert stdout.getvalue().count("\n") == 10
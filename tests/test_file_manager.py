@@ -1,5 +1,8 @@
+import threading
 import pytest
+from pathlib import Path
 from unittest.mock import MagicMock, call
+from src import futils
 from src.futils import FileManager, FileSelection, FileSystem
 from src.ui import UserInterface, ErrorChoice
 
@@ -8,7 +11,11 @@ class MockFileSelection(FileSelection):
         self.files_to_return = files_to_return or []
 
     def get_and_reset(self) -> list[str]:
-        return self.files_to_return
+        res, self.files_to_return = self.files_to_return, []
+        return res
+
+    def peek_count(self) -> int:
+        return len(self.files_to_return)
 
 class MockFileSystem(FileSystem):
     def copy(self, src: str, dest: str) -> None:
@@ -180,6 +187,36 @@ class TestFileManager:
         assert result == 0
         assert call("Move: File locked") in self.ui.error.call_args_list
 
+    def test_failing_on_change_does_not_abort(self, setup_mocks):
+        manager = setup_mocks
+        manager.on_change = MagicMock(side_effect=OSError("No such file or directory"))
+        
+        result = manager.delete_files()
+        
+        assert result == 2
+        assert "no such file" in str(self.ui.error.call_args_list).lower()
+
+    def test_copy_files_path_destination(self, setup_mocks):
+        manager = setup_mocks
+        destination = Path("/dest")
+        
+        result = manager.copy_files(destination)
+        
+        assert result == 2
+        self.file_system.copy.assert_has_calls([
+            call("file1.txt", destination),
+            call("file2.txt", destination)
+        ])
+        self.ui.error.assert_not_called()
+
+    def test_selection_consumed_once(self, setup_mocks):
+        manager = setup_mocks
+        
+        assert manager.copy_files("/dest") == 2
+        assert manager.copy_files("/dest") == 0
+        
+        assert self.file_system.copy.call_count == 2
+
     def test_empty_selection(self, setup_mocks):
         self.selection.files_to_return = []
         manager = setup_mocks
@@ -192,6 +229,35 @@ class TestFileManager:
         self.file_system.copy.assert_not_called()
         self.file_system.move.assert_not_called() 
 
+    def test_empty_selection_skips_destination_validation(self, setup_mocks):
+        self.selection.files_to_return = []
+        manager = setup_mocks
+        
+        assert manager.copy_files("bad\0dest") == 0
+        
+        self.ui.error.assert_not_called()
+
+    def test_operations_notify_changed_paths(self, setup_mocks):
+        """Test that mutating operations report the paths they touched.
+        
+        Given:
+            - An on_change callback
+        When:
+            - move_files() is called
+        Then:
+            - Should notify the destination and every moved file
+        """
+        manager = setup_mocks
+        manager.on_change = MagicMock()
+        
+        manager.move_files("/dest")
+        
+        manager.on_change.assert_has_calls([
+            call("/dest"),
+            call("file1.txt"),
+            call("file2.txt")
+        ])
+
 class TestFileManagerErrorHandling:
     @pytest.fixture
     def setup_mocks(self):
@@ -264,6 +330,60 @@ class TestFileManagerErrorHandling:
         assert self.file_system.delete.call_count == 3
         self.ui.error_choice.assert_called_once()
 
+    def test_errors_reported_in_one_batch(self, setup_mocks):
+        """Test that errors of one operation are sent to the UI together.
+        
+        Given:
+            - Three files to delete, all failing
+            - User chooses to ignore all errors
+        When:
+            - delete_files() is called
+        Then:
+            - Should send all error messages in a single batch
+        """
+        manager = setup_mocks
+        self.ui.errors_batch = MagicMock()
+        self.file_system.delete.side_effect = [
+            OSError("Error 1"),
+            OSError("Error 2"),
+            OSError("Error 3")
+        ]
+        self.ui.error_choice.return_value = ErrorChoice.IGNORE_ALL
+        
+        manager.delete_files()
+        
+        self.ui.errors_batch.assert_called_once_with([
+            "Delete: Error 1",
+            "Delete: Error 2",
+            "Delete: Error 3"
+        ])
+
+    def test_errors_flushed_when_operation_raises(self, setup_mocks):
+        """Test that queued errors never leak into the next operation.
+        
+        Given:
+            - A first file failing, then an error_choice dialog that raises
+        When:
+            - delete_files() is called twice
+        Then:
+            - The first call should still report its error
+            - The second call should not report it again
+        """
+        manager = setup_mocks
+        self.file_system.delete.side_effect = OSError("boom")
+        self.ui.error_choice.side_effect = EOFError()
+        
+        with pytest.raises(EOFError):
+            manager.delete_files()
+        
+        assert self.ui.error.call_args_list == [call("Delete: boom")]
+        
+        self.selection.files_to_return = ["file4.txt"]
+        self.file_system.delete.side_effect = None
+        
+        assert manager.delete_files() == 1
+        assert self.ui.error.call_args_list == [call("Delete: boom")]
+
     def test_delete_files_stop_on_error(self, setup_mocks):
         manager = setup_mocks
         self.file_system.delete.side_effect = [
@@ -450,4 +570,149 @@ class TestFileManagerEdgeCases:
         result = manager.move_files("/dest")
         
         assert result == 0
-        assert "in use" in str(self.ui.error.call_args_list).lower() 
\ No newline at end of file
+        assert "in use" in str(self.ui.error.call_args_list).lower() 
+
+    def test_invalid_source_path_is_skipped(self, setup_mocks):
+        """Test that a source path that cannot be resolved is skipped.
+        
+        Given:
+            - A file path containing a null byte
+            - A valid file path
+        When:
+            - copy_files() is called
+        Then:
+            - Should only copy the valid file
+            - Should report the invalid path like any other copy error
+        """
+        manager = setup_mocks
+        self.selection.files_to_return = ["bad\0file.txt", "file2.txt"]
+        self.ui.error_choice.return_value = ErrorChoice.IGNORE
+        
+        result = manager.copy_files("/dest")
+        
+        assert result == 1
+        self.file_system.copy.assert_called_once_with("file2.txt", "/dest")
+        assert call("Copy: Invalid path: embedded null byte") in self.ui.error.call_args_list
+        self.ui.error_choice.assert_called_once()
+
+class TestFileManagerParallel:
+    @pytest.fixture
+    def setup_mocks(self):
+        """Set up mock objects for testing parallel operations.
+        
+        Returns:
+            FileManager: A FileManager instance running operations in a thread pool.
+        """
+        self.test_files = ["file1.txt", "file2.txt", "file3.txt"]
+        self.selection = MockFileSelection(self.test_files)
+        self.file_system = MockFileSystem()
+        self.ui = MockUserInterface()
+        
+        self.file_system.copy = MagicMock()
+        self.file_system.move = MagicMock()
+        self.file_system.delete = MagicMock()
+        self.ui.error = MagicMock()
+        self.ui.error_choice = MagicMock(return_value=ErrorChoice.IGNORE)
+        
+        return FileManager(self.selection, self.file_system, self.ui, parallel=True)
+
+    def test_copy_files_parallel_success(self, setup_mocks):
+        manager = setup_mocks
+        
+        result = manager.copy_files("/dest")
+        
+        assert result == 3
+        self.file_system.copy.assert_has_calls([
+            call("file1.txt", "/dest"),
+            call("file2.txt", "/dest"),
+            call("file3.txt", "/dest")
+        ], any_order=True)
+        self.ui.error.assert_not_called()
+
+    def test_delete_files_parallel_with_error(self, setup_mocks):
+        manager = setup_mocks
+        
+        def delete(path):
+            if path == "file2.txt":
+                raise OSError("Permission denied")
+        self.file_system.delete.side_effect = delete
+        
+        result = manager.delete_files()
+        
+        assert result == 2
+        assert self.file_system.delete.call_count == 3
+        assert call("Delete: Permission denied") in self.ui.error.call_args_list
+        self.ui.error_choice.assert_called_once()
+
+
+    @pytest.fixture
+    def blocking_delete(self, setup_mocks, monkeypatch):
+        """Select more files than worker threads; the first fails, the others block.
+        
+        Blocked deletions are only released once the executor has cancelled its
+        pending work, so the number of processed files is deterministic.
+        
+        Returns:
+            FileManager: The configured FileManager instance.
+        """
+        self.selection.files_to_return = [f"file{i}.txt" for i in range(40)]
+        release = threading.Event()
+        
+        def delete(path):
+            if path == "file0.txt":
+                raise OSError("Error with file0")
+            release.wait(timeout=5)
+        self.file_system.delete.side_effect = delete
+        
+        class ReleasingExecutor(futils.ThreadPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                if cancel_futures:
+                    super().shutdown(wait=False, cancel_futures=True)
+                    release.set()
+                super().shutdown(wait=wait)
+        monkeypatch.setattr(futils, "ThreadPoolExecutor", ReleasingExecutor)
+        
+        return setup_mocks
+
+    def test_delete_files_parallel_stop_cancels_pending(self, blocking_delete):
+        """Test that choosing STOP cancels files not yet started.
+        
+        Given:
+            - More files than worker threads
+            - The first file failing while the others block
+            - User choosing to stop
+        When:
+            - delete_files() is called
+        Then:
+            - Queued files should be cancelled and never deleted
+            - Only the files that completed should be counted
+        """
+        manager = blocking_delete
+        self.ui.error_choice.return_value = ErrorChoice.STOP
+        
+        result = manager.delete_files()
+        
+        assert self.file_system.delete.call_count < 40
+        assert result == self.file_system.delete.call_count - 1
+        self.ui.error_choice.assert_called_once()
+
+    def test_delete_files_parallel_prompt_raises(self, blocking_delete):
+        """Test that an interrupted error prompt cancels files not yet started.
+        
+        Given:
+            - More files than worker threads
+            - The first file failing while the others block
+            - The error prompt raising (e.g. EOF at the input)
+        When:
+            - delete_files() is called
+        Then:
+            - The exception should propagate
+            - Queued files should be cancelled and never deleted
+        """
+        manager = blocking_delete
+        self.ui.error_choice.side_effect = EOFError()
+        
+        with pytest.raises(EOFError):
+            manager.delete_files()
+        
+        assert self.file_system.delete.call_count < 40